@@ -2,12 +2,28 @@ r"""GitHub saver for stargazers, forks, repos. Can clone all user repos.
 """
 
 import os
+import re
 import json
+import base64
+import hashlib
+import tempfile
+import subprocess
 import argparse
+import time
 import logging
+import threading
 import requests
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Iterator, Optional, Tuple
+from collections import Counter
 from functools import cached_property
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 logger = logging.getLogger(__name__)
@@ -27,19 +43,114 @@ class GitHubSaver:
     user_forks: bool
         Save forked repos by user. Default: False.
 
+    max_workers: int
+        Number of concurrent requests to GitHub API. Default: 5.
+
+    cache_dir: Optional[str]
+        Directory for ETags and bodies of API responses. Unchanged REST data is validated with
+        conditional requests. GraphQL has no ETags, so its responses are reused only within `cache_ttl`.
+        Default: None (no cache).
+
+    cache_ttl: int
+        Seconds during which cached API responses are used without any request. Default: 0.
+
     """
     API_URL = "https://api.github.com/"
+    GRAPHQL_URL = "https://api.github.com/graphql"
+    GRAPHQL_QUERY = """
+    query($owner: String!, $name: String!, $cursor: String) {
+      repository(owner: $owner, name: $name) {
+        %s(first: 100, after: $cursor) {
+          pageInfo { endCursor hasNextPage }
+          nodes { %s }
+        }
+      }
+    }
+    """
     HEADERS = {
         "Accept": "application/vnd.github.v3+json",
-        "Authorization": "",
+        "Accept-Encoding": "gzip, deflate",
+        "User-Agent": "github_backup",
     }
-
-    def __init__(self, user_login: str, user_token: Optional[str] = None, user_forks: bool = False):
+    MAX_ZIP_SIZE = 1 << 30
+    RATE_LIMIT_THRESHOLD = 10
+    RATE_LIMIT_ATTEMPTS = 5
+
+    def __init__(
+            self,
+            user_login: str,
+            user_token: Optional[str] = None,
+            user_forks: bool = False,
+            max_workers: int = 5,
+            cache_dir: Optional[str] = None,
+            cache_ttl: int = 0,
+    ):
         self._user_login = user_login
         self._user_forks = user_forks
+        self._max_workers = max_workers
         self.__user_token = user_token
+
+        self._rate_lock = threading.Lock()
+        self._resume_at = 0.0
+
+        self._cache_dir = cache_dir
+        self._cache_ttl = cache_ttl
+        # Cached responses depend on token, e.g. private repos are listed only for authorized user
+        self._cache_auth = hashlib.sha1(user_token.encode()).hexdigest()[:12] if user_token else "anon"
+        self._etags_lock = threading.Lock()
+        self._etags = self.__load_etags()
+
+        self._session = requests.Session()
+        self._session.headers.update(self.HEADERS)
         if user_token is not None:
-            self.HEADERS.update({"Authorization": user_token})
+            self._session.headers.update({"Authorization": f"Bearer {user_token}"})
+        # Rate limits (403, 429) are handled by `__request`, return the last response instead of `RetryError`
+        retries = Retry(total=5, backoff_factor=0.5, status_forcelist=[502, 503, 504], raise_on_status=False)
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retries))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Close HTTP session and save ETags"""
+        self._session.close()
+        if self._cache_dir:
+            with open(os.path.join(self._cache_dir, "etags.json"), "w") as f:
+                json.dump(self._etags, f, indent=2)
+
+    def __load_etags(self) -> dict:
+        if not self._cache_dir:
+            return {}
+
+        os.makedirs(os.path.join(self._cache_dir, "bodies"), exist_ok=True)
+        try:
+            with open(os.path.join(self._cache_dir, "etags.json")) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def __body_path(self, key: str) -> str:
+        return os.path.join(self._cache_dir, "bodies", f"{hashlib.sha1(key.encode()).hexdigest()}.json")
+
+    def __read_body(self, key: str):
+        with open(self.__body_path(key), "rb") as f:
+            return self._loads(f.read())
+
+    def __write_body(self, key: str, content: bytes, **entry):
+        with open(self.__body_path(key), "wb") as f:
+            f.write(content)
+        with self._etags_lock:
+            self._etags[key] = {**entry, "time": time.time()}
+
+    def __cached_entry(self, key: str) -> Optional[dict]:
+        cached = self._etags.get(key) if self._cache_dir else None
+        return cached if cached and os.path.isfile(self.__body_path(key)) else None
+
+    def __is_fresh(self, cached: Optional[dict]) -> bool:
+        return bool(cached) and time.time() - cached.get("time", 0) < self._cache_ttl
 
     @property
     def user_login(self):
@@ -77,19 +188,172 @@ class GitHubSaver:
         """List of links to repos starred by user"""
         return self._remote_request(content=self._starred_list, clone_url=True)
 
-    def __response(self, url: str, stage: str = "") -> list:
-        response = requests.get(url=os.path.join(url, stage), headers=self.HEADERS)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            logger.warning(f"Cannot get response from {url}")
+    def __pause(self, delay: float):
+        """Postpone all requests from all workers for `delay` seconds"""
+        with self._rate_lock:
+            resume_at = time.time() + max(delay, 0)
+            if resume_at > self._resume_at:
+                logger.warning(f"Rate limit is reached, pause requests for {delay:.0f} s")
+                self._resume_at = resume_at
+
+    def __wait_rate_limit(self):
+        with self._rate_lock:
+            delay = self._resume_at - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+    def __check_rate_limit(self, response: requests.Response, attempt: int = 0) -> bool:
+        """Schedule cooldown from `X-RateLimit-*` headers. Return True if request should be retried"""
+        headers = response.headers
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset_delay = int(headers.get("X-RateLimit-Reset", 0)) - time.time()
+
+        limited = response.status_code == 429 or (
+            response.status_code == 403
+            and ("Retry-After" in headers or remaining == "0" or "rate limit" in response.text.lower())
+        )
+        if limited:
+            if "Retry-After" in headers:
+                self.__pause(int(headers["Retry-After"]))
+            elif remaining == "0":
+                self.__pause(reset_delay)
+            else:
+                self.__pause(min(60, 2 ** attempt))
+            return True
+
+        if remaining is not None and int(remaining) < self.RATE_LIMIT_THRESHOLD:
+            self.__pause(reset_delay)
+        return False
+
+    def __request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """HTTP request which respects GitHub rate limits"""
+        for attempt in range(self.RATE_LIMIT_ATTEMPTS):
+            self.__wait_rate_limit()
+            response = self._session.request(method, url=url, **kwargs)
+            if not self.__check_rate_limit(response, attempt):
+                return response
+            if attempt < self.RATE_LIMIT_ATTEMPTS - 1:
+                response.close()
+
+        logger.warning(f"Rate limit is exceeded for {url} after {self.RATE_LIMIT_ATTEMPTS} attempts")
+        return response
+
+    @staticmethod
+    def _url_join(url: str, stage: str = "") -> str:
+        """Join url parts with '/'. Unlike `os.path.join` it does not use backslashes on Windows"""
+        return f"{url.rstrip('/')}/{stage.lstrip('/')}" if stage else url
+
+    @staticmethod
+    def _loads(content: bytes):
+        return orjson.loads(content) if orjson else json.loads(content)
+
+    def __graphql(self, url: str, connection: str, fields: str) -> Optional[list]:
+        """Get all nodes of repository `connection` with GraphQL. Return None if API is not available"""
+        if not self.__user_token:
+            return None
+
+        owner, name = url.rstrip("/").split("/")[-2:]
+        query = self.GRAPHQL_QUERY % (connection, fields)
+        nodes, cursor = [], None
+        while True:
+            payload = {"query": query, "variables": {"owner": owner, "name": name, "cursor": cursor}}
+            key = f"{self._cache_auth}:{self.GRAPHQL_URL}:{json.dumps(payload, sort_keys=True)}"
+            if self.__is_fresh(cached := self.__cached_entry(key)):
+                logger.debug(f"Fresh in cache: GraphQL {connection} for {url}, cursor {cursor}")
+                content = self.__read_body(key)
+            else:
+                try:
+                    response = self.__request("POST", self.GRAPHQL_URL, json=payload)
+                except requests.RequestException as error:
+                    logger.debug(f"Cannot get {connection} for {url} with GraphQL: {error}")
+                    return None
+
+                if response.status_code != 200:
+                    logger.debug(f"Cannot get {connection} for {url} with GraphQL: {response.status_code}")
+                    return None
+
+                content = self._loads(response.content)
+                if content.get("errors") or not (content.get("data") or {}).get("repository"):
+                    logger.debug(f"Cannot get {connection} for {url} with GraphQL: {content.get('errors')}")
+                    return None
+                if self._cache_dir:
+                    self.__write_body(key, response.content)
+
+            page = content["data"]["repository"][connection]
+            nodes.extend(page["nodes"])
+            if not page["pageInfo"]["hasNextPage"]:
+                return nodes
+            cursor = page["pageInfo"]["endCursor"]
+
+    def __get_page(self, url: str, params: Optional[dict] = None) -> Optional[Tuple[list, Optional[str]]]:
+        """Get page content and link to the next page. Revalidate cached page with `If-None-Match`"""
+        key = f"{self._cache_auth}:{requests.Request('GET', url, params=params).prepare().url}"
+        cached = self.__cached_entry(key)
+        if self.__is_fresh(cached):
+            logger.debug(f"Fresh in cache: {key}")
+            return self.__read_body(key), cached["next"]
+
+        headers = {"If-None-Match": cached["etag"]} if cached else {}
+        try:
+            response = self.__request("GET", url, params=params, headers=headers)
+        except requests.RequestException as error:
+            if not cached:
+                logger.warning(f"Cannot get response from {url}: {error}")
+                return None
+            logger.warning(f"Use cached response for {key}: {error}")
+            return self.__read_body(key), cached["next"]
+
+        if cached and response.status_code >= 500:
+            logger.warning(f"Use cached response for {key}: {response.status_code}")
+            return self.__read_body(key), cached["next"]
+
+        if cached and response.status_code == 304:
+            logger.debug(f"Not modified: {key}")
+            with self._etags_lock:
+                cached["time"] = time.time()
+            return self.__read_body(key), cached["next"]
+
+        if response.status_code != 200:
+            return None
+
+        logger.debug(f"Get {key}, Content-Encoding: {response.headers.get('Content-Encoding')}")
+        next_url = response.links.get("next", {}).get("url")
+        if self._cache_dir and (etag := response.headers.get("ETag")):
+            self.__write_body(key, response.content, etag=etag, next=next_url)
+        return self._loads(response.content), next_url
+
+    def __paginate(self, url: str, stage: str = "") -> Iterator[dict]:
+        """Yield items from all pages following `Link: rel="next"` headers"""
+        next_url, params = self._url_join(url, stage), {"per_page": 100}
+        while next_url:
+            if (page := self.__get_page(next_url, params)) is None:
+                logger.warning(f"Cannot get response from {next_url}")
+                return
+
+            items, next_url = page
+            yield from items
+            params = None
 
     def __api_request(self, stage: str) -> list:
-        response = self.__response(self.API_URL, stage=f"users/{self._user_login}/{stage}")
+        response = list(self.__paginate(self.API_URL, stage=f"users/{self._user_login}/{stage}"))
         if not response:
             raise Exception(f"Cannot get response for {self._user_login}, {stage}")
         return response
 
+    @staticmethod
+    def _repo_name(url: str) -> str:
+        """Repository name from API or clone url"""
+        repo_name = url.rstrip("/").rsplit("/", 1)[-1]
+        return repo_name[:-len(".git")] if repo_name.endswith(".git") else repo_name
+
+    def _repo_names(self, urls: list) -> list:
+        """Repository names, prefixed with owner if the same name belongs to several owners"""
+        names = [self._repo_name(url) for url in urls]
+        counts = Counter(names)
+        return [
+            f"{url.rstrip('/').split('/')[-2]}_{name}" if counts[name] > 1 else name for url, name in zip(urls, names)
+        ]
+
     def _remote_request(self, content: list, clone_url: bool = False) -> list:
         repos = []
         for repo in content:
@@ -111,15 +375,23 @@ class GitHubSaver:
         else:
             raise NotImplemented(f"Implement method for {destination}")
 
+        repositories = self.owner_repositories
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            results = executor.map(method, repositories)
+
         repo_dict = {}
-        for repo_url in self.owner_repositories:
-            repo_name = os.path.basename(repo_url)
-            if result := method(repo_url):
+        for repo_url, result in zip(repositories, results):
+            repo_name = self._repo_name(repo_url)
+            if result:
                 repo_dict[repo_name] = result
 
         save_path = f"{self._user_login}_{destination}.json"
-        with open(save_path, "w") as f:
-            json.dump(repo_dict, f, indent=2, ensure_ascii=True)
+        if orjson:
+            with open(save_path, "wb") as f:
+                f.write(orjson.dumps(repo_dict, option=orjson.OPT_INDENT_2))
+        else:
+            with open(save_path, "w") as f:
+                json.dump(repo_dict, f, indent=2, ensure_ascii=True)
 
     def save_stargazers(self):
         """Save all stargazers"""
@@ -137,74 +409,140 @@ class GitHubSaver:
         """Save all repos"""
         repositories = self.user_starred_list if starred else self.owner_repositories
 
-        for repo_url in repositories:
-            repo_name = os.path.basename(repo_url)
-            repo_resp = requests.get(url=os.path.join(repo_url, "zipball"))
-            if repo_resp.status_code == 200:
-                repo_path = os.path.join(save_path, f"{repo_name}.zip")
-                logger.info(f"Save {repo_url} to {repo_path}")
+        def _download_one(repo_url: str, repo_name: str):
+            repo_path = os.path.join(save_path, f"{repo_name}.zip")
+            if not force and os.path.isfile(repo_path):
+                logger.info(f"Repo {repo_url} is already saved!")
+                return
 
-                if force or not os.path.isfile(repo_path):
-                    with open(repo_path, 'wb') as ff:
-                        ff.write(repo_resp.content)
-                else:
-                    logger.info(f"Repo {repo_resp} is already saved!")
+            part_path = f"{repo_path}.part"
+            try:
+                with self.__request("GET", self._url_join(repo_url, "zipball"), stream=True, timeout=60) as repo_resp:
+                    if repo_resp.status_code != 200:
+                        logger.warning(f"Cannot download repo {repo_resp}")
+                        return
+
+                    if int(repo_resp.headers.get("Content-Length", 0)) > self.MAX_ZIP_SIZE:
+                        logger.warning(f"Skip {repo_url}: archive is larger than {self.MAX_ZIP_SIZE} bytes")
+                        return
+
+                    logger.info(f"Save {repo_url} to {repo_path}")
+                    with open(part_path, 'wb') as ff:
+                        for chunk in repo_resp.iter_content(chunk_size=1 << 16):
+                            ff.write(chunk)
+                os.replace(part_path, repo_path)
+            except requests.RequestException as error:
+                logger.warning(f"Cannot download repo {repo_url}: {error}")
+                if os.path.isfile(part_path):
+                    os.remove(part_path)
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            list(executor.map(_download_one, repositories, self._repo_names(repositories)))
+
+    def clone_repos(
+            self,
+            clone_path: str = ".",
+            bare: bool = False,
+            recursive: bool = False,
+            starred: bool = False,
+            shallow: bool = False,
+    ):
+        """Clone all repos. Shallow clone keeps only the latest commit of the default branch"""
+        repositories = self.user_starred_links if starred else self.owner_clone_links
 
+        env = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+        askpass = None
+        if self.__user_token:
+            # Pass credentials via environment to keep token out of argv and `.git/config`
+            if self._git_version() >= (2, 31):
+                credentials = base64.b64encode(f"{self._user_login}:{self.__user_token}".encode()).decode()
+                count = int(env.get("GIT_CONFIG_COUNT", 0))
+                env.update({
+                    "GIT_CONFIG_COUNT": str(count + 1),
+                    f"GIT_CONFIG_KEY_{count}": "http.https://github.com/.extraheader",
+                    f"GIT_CONFIG_VALUE_{count}": f"Authorization: Basic {credentials}",
+                })
+            elif os.name != "nt":
+                askpass = self.__askpass_script()
+                env.update({
+                    "GIT_ASKPASS": askpass,
+                    "GITHUB_BACKUP_USER": self._user_login,
+                    "GITHUB_BACKUP_TOKEN": self.__user_token,
+                })
             else:
-                logger.warning(f"Cannot download repo {repo_resp}")
+                logger.warning("git >= 2.31 is required to pass user token, private repos cannot be cloned")
 
-    def clone_repos(self, clone_path: str = ".", bare: bool = False, recursive: bool = False, starred: bool = False):
-        """Save all repos"""
-        repositories = self.user_starred_links if starred else self.owner_clone_links
-
-        for repo_url in repositories:
-            repo_name, _ = os.path.splitext(os.path.basename(repo_url))
+        def _clone_one(repo_url: str, repo_name: str):
             repo_path = os.path.join(clone_path, repo_name)
             logger.info(f"Clone {repo_url} to {repo_path}")
 
-            if self.__user_token:
-                repo_url = repo_url.replace("github.com", f"{self._user_login}:{self.__user_token}@github.com")
-
-            command = f"git clone {repo_url} {repo_path}" + " --bare" * bare + " --recursive" * recursive
+            command = ["git", "clone", repo_url, repo_path] + ["--bare"] * bare + ["--recursive"] * recursive
+            if shallow:
+                command += ["--depth", "1", "--single-branch"] + ["--shallow-submodules"] * recursive
             try:
-                os.system(command)
-            except SystemError:
-                logger.warning(f"Cannot clone {repo_url}")
+                if subprocess.run(command, env=env, check=False).returncode != 0:
+                    logger.warning(f"Cannot clone {repo_url}")
+            except OSError as error:
+                logger.warning(f"Cannot clone {repo_url}: {error}")
+
+        try:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                list(executor.map(_clone_one, repositories, self._repo_names(repositories)))
+        finally:
+            if askpass:
+                os.remove(askpass)
+
+    @staticmethod
+    def _git_version() -> tuple:
+        try:
+            output = subprocess.run(["git", "--version"], capture_output=True, text=True, check=False).stdout
+        except OSError:
+            return ()
+        match = re.search(r"(\d+)\.(\d+)", output)
+        return tuple(map(int, match.groups())) if match else ()
+
+    @staticmethod
+    def __askpass_script() -> str:
+        """Script for `GIT_ASKPASS` which reads credentials from environment"""
+        with tempfile.NamedTemporaryFile("w", suffix=".sh", delete=False) as f:
+            f.write(
+                '#!/bin/sh\n'
+                'case "$1" in\n'
+                '    Username*) echo "$GITHUB_BACKUP_USER" ;;\n'
+                '    *) echo "$GITHUB_BACKUP_TOKEN" ;;\n'
+                'esac\n'
+            )
+        os.chmod(f.name, 0o700)
+        return f.name
 
     def get_stargazers(self, url: str) -> list:
         """Get all stargazers"""
-        star_list = []
-        if response := self.__response(url, "stargazers"):
-            for gazer in response:
-                star_list.append(
-                    {
-                        'login': gazer['login'],
-                        'id': gazer['id'],
-                        'node_id': gazer['node_id'],
-                    }
-                )
-            logger.info(f"Get stargazers for {url}")
+        if (nodes := self.__graphql(url, "stargazers", "login databaseId id")) is not None:
+            star_list = [{'login': g['login'], 'id': g['databaseId'], 'node_id': g['id']} for g in nodes]
+        else:
+            star_list = [
+                {'login': g['login'], 'id': g['id'], 'node_id': g['node_id']}
+                for g in self.__paginate(url, "stargazers")
+            ]
+        logger.info(f"Get stargazers for {url}")
         return star_list
 
     def get_forks(self, url: str) -> list:
         """Get all forks"""
-        fork_list = []
-        if response := self.__response(url, "forks"):
-            for fork in response:
-                fork_list.append(
-                    {
-                        'login': fork['owner']['login'],
-                        'id': fork['id'],
-                        'node_id': fork['node_id'],
-                    }
-                )
-            logger.info(f"Get forks for {url}")
+        if (nodes := self.__graphql(url, "forks", "databaseId id owner { login }")) is not None:
+            fork_list = [{'login': f['owner']['login'], 'id': f['databaseId'], 'node_id': f['id']} for f in nodes]
+        else:
+            fork_list = [
+                {'login': f['owner']['login'], 'id': f['id'], 'node_id': f['node_id']}
+                for f in self.__paginate(url, "forks")
+            ]
+        logger.info(f"Get forks for {url}")
         return fork_list
 
     def get_issues(self, url: str) -> list:
         """Get all issues"""
         logger.info(f"Get issues for {url}")
-        return self.__response(url, "issues")
+        return list(self.__paginate(url, "issues"))
 
 
 def __parser_github():
@@ -215,6 +553,12 @@ def __parser_github():
     parser.add_argument("--user_forks", action="store_true", help="Save forked repos by user")
     parser.add_argument("-v", "--verbose", action="store_true", help="Logging level=debug")
     parser.add_argument("-f", "--force", action="store_true", help="Force save")
+    parser.add_argument("-w", "--workers", type=int, default=5, help="Number of concurrent requests")
+    parser.add_argument(
+        "--cache_dir", type=str, default="~/.cache/github_backup", help="Cache for ETags of API responses"
+    )
+    parser.add_argument("--no_cache", action="store_true", help="Disable cache of API responses")
+    parser.add_argument("--cache_ttl", type=int, default=600, help="Use cached API responses without requests, sec")
 
     parser.add_argument("--forks", action="store_true", help="Save list of forks")
     parser.add_argument("--stars", action="store_true", help="Save list of stargazers")
@@ -224,6 +568,7 @@ def __parser_github():
     groups.add_argument("--clone", action="store_true", help=f"Clone repos to `save_path`")
     parser.add_argument("--bare", action="store_true", help="Clone a bare git repo")
     parser.add_argument("--recursive", action="store_true", help="Recursive submodules")
+    parser.add_argument("--shallow", action="store_true", help="Clone only the latest commit without history")
     parser.add_argument("--starred", action="store_true", help="Get repositories starred by user")
     parser.add_argument("-p", "--save_path", type=str, default=".", help="Save path to your repos")
     parser.add_argument("-l", "--repo_list", nargs="+", help="List of repos to clone or to save")
@@ -240,35 +585,38 @@ def __parser_github():
         level=logging.DEBUG if args.verbose else logging.INFO
     )
 
-    github_saver = GitHubSaver(
+    with GitHubSaver(
         user_login=args.user_login,
         user_token=args.user_token,
         user_forks=args.user_forks,
-    )
-
-    if args.stars:
-        github_saver.save_stargazers()
-
-    if args.forks:
-        github_saver.save_forks()
-
-    if args.issues:
-        github_saver.save_issues()
-
-    if args.save:
-        github_saver.save_repos(
-            save_path=args.save_path,
-            force=args.force,
-            starred=args.starred,
-        )
-
-    if args.clone:
-        github_saver.clone_repos(
-            clone_path=args.save_path,
-            bare=args.bare,
-            recursive=args.recursive,
-            starred=args.starred,
-        )
+        max_workers=args.workers,
+        cache_dir=None if args.no_cache else os.path.expanduser(args.cache_dir),
+        cache_ttl=args.cache_ttl,
+    ) as github_saver:
+        if args.stars:
+            github_saver.save_stargazers()
+
+        if args.forks:
+            github_saver.save_forks()
+
+        if args.issues:
+            github_saver.save_issues()
+
+        if args.save:
+            github_saver.save_repos(
+                save_path=args.save_path,
+                force=args.force,
+                starred=args.starred,
+            )
+
+        if args.clone:
+            github_saver.clone_repos(
+                clone_path=args.save_path,
+                bare=args.bare,
+                recursive=args.recursive,
+                starred=args.starred,
+                shallow=args.shallow,
+            )
 
 
 if __name__ == '__main__':